@@ -410,7 +410,7 @@ fi
 source "$INSTALL_DIR/venv/bin/activate"
 
 # Check if packages are already installed (unless --force)
-if [ "$FORCE_INSTALL" = false ] && pip show requests sounddevice scipy numpy evdev &>/dev/null; then
+if [ "$FORCE_INSTALL" = false ] && pip show requests orjson sounddevice numpy evdev &>/dev/null; then
     echo_success "Python dependencies already installed ✓"
 else
     echo_info "Installing Python packages (this may take a minute)..."
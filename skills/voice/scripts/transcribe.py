@@ -150,7 +150,7 @@ def main():
         sys.exit(1)
 
     try:
-        # Initialize transcriber (checks whisper.cpp server connection)
+        # Initialize transcriber (server is checked when transcribing)
         transcriber = VoiceTranscriber()
 
         # Record audio
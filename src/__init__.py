@@ -12,11 +12,12 @@ Core components:
 - platform_detect: Cross-platform abstraction for clipboard/keyboard/notifications
 """
 
-from .voice_to_claude import VoiceTranscriber
+from .voice_to_claude import VoiceTranscriber, WhisperServerDown
 from .platform_detect import get_platform_info, PlatformInfo
 
 __all__ = [
     'VoiceTranscriber',
+    'WhisperServerDown',
     'get_platform_info',
     'PlatformInfo',
 ]
@@ -4,9 +4,20 @@ Platform Detection Module
 Detects Linux display server, desktop environment, and available tools
 for cross-platform compatibility
 """
+import functools
+import hashlib
+import json
 import os
+import select
+import shlex
+import signal
+import socket
+import struct
 import subprocess
-import shutil
+import sys
+import tempfile
+import threading
+import time
 from typing import Dict, Optional, List
 
 # ydotool key codes for keyboard simulation
@@ -14,20 +25,296 @@ YDOTOOL_KEY_LEFT_SHIFT = 42
 YDOTOOL_KEY_LEFT_CTRL = 29
 YDOTOOL_KEY_V = 47
 
+# ydotoold socket protocol: raw Linux input_event structs over a datagram socket
+YDOTOOL_SOCKET_FALLBACK = '/tmp/.ydotool_socket'
+YDOTOOL_KEY_DELAY = 0.012  # seconds between key events (ydotool's default)
+_INPUT_EVENT = struct.Struct('llHHi')  # struct timeval, type, code, value
+_EV_SYN = 0
+_EV_KEY = 1
+_SYN_REPORT = 0
+
+# On-disk cache of detection results, shared between CLI invocations
+PLATFORM_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'voice-to-claude', 'platform.json'
+)
+PLATFORM_CACHE_TTL = 24 * 60 * 60  # seconds
+PLATFORM_CACHE_VERSION = 1  # bump when the cached data layout changes
+# Detected attributes persisted to (and restored from) the cache file
+_CACHED_ATTRIBUTES = ('display_server', 'desktop_env', 'available_tools', 'distro')
+
+
+# PATH scan shared by all _fast_which() calls: the PATH value it was built
+# for, and command name -> candidate paths in PATH order
+_which_path: Optional[str] = None
+_which_candidates: Dict[str, List[str]] = {}
+
+
+def _fast_which(cmd: str) -> Optional[str]:
+    """Locate cmd in PATH like shutil.which, scanning PATH only once.
+
+    The first call reads every PATH directory with os.scandir, using only
+    the directory entry type (no stat per file). Later calls are dict
+    lookups; the executable check runs just for the command asked for.
+    """
+    global _which_path, _which_candidates
+
+    path = os.environ.get('PATH')
+    if path is None:
+        # Same fallback as shutil.which when PATH is unset
+        path = os.confstr('CS_PATH') or os.defpath
+    if path != _which_path:
+        candidates: Dict[str, List[str]] = {}
+        for path_dir in path.split(os.pathsep):
+            if not path_dir:
+                continue
+            try:
+                with os.scandir(path_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            candidates.setdefault(entry.name, []).append(entry.path)
+            except OSError:
+                # Missing or unreadable PATH entry - skip it like shutil.which
+                continue
+        _which_path = path
+        _which_candidates = candidates
+
+    for cmd_path in _which_candidates.get(cmd, ()):
+        if os.path.isfile(cmd_path) and os.access(cmd_path, os.X_OK):
+            return cmd_path
+    return None
+
+
+class _ShellHelper:
+    """Long-lived shell that runs clipboard/keyboard tool commands.
+
+    Forking a small sh for each action is much cheaper than forking the
+    Python process (numpy, audio buffers) via subprocess.run every time.
+    The shell itself is started once with posix_spawn, which avoids
+    duplicating the parent's page tables.
+    """
+
+    _PID_MARKER = b'__voice_to_claude_pid__'
+    _STATUS_MARKER = b'__voice_to_claude_status__'
+
+    def __init__(self):
+        self._pid = None
+        self._stdin = None  # Buffered writer for the shell's stdin pipe
+        self._stdout_fd = None
+        self._output = b''  # Shell output read but not yet consumed
+        self._lock = threading.Lock()
+
+    def run(self, argv: List[str], data: Optional[bytes] = None,
+            data_as_arg: bool = False, timeout: float = 5) -> bool:
+        """
+        Run a command in the helper shell and wait for it to finish
+
+        Args:
+            argv: Command and arguments
+            data: Bytes piped to the command's stdin (or appended as the
+                  last argument if data_as_arg is True)
+            timeout: Seconds to wait before giving up on the command
+
+        Returns:
+            True if the command exited with status 0
+        """
+        cmd = ' '.join(shlex.quote(arg) for arg in argv).encode()
+        if data is None:
+            line = cmd + b" </dev/null"
+        elif data_as_arg:
+            line = cmd + b" " + self._quote(data) + b" </dev/null"
+        else:
+            # printf is a shell builtin - no extra process for the pipe source
+            line = b"printf '%s' " + self._quote(data) + b" | " + cmd
+        # Run the command in the background so we learn its pid (to kill just
+        # it on timeout), then wait for it. Tool stdout is discarded so the
+        # only things we read back are the pid and the exit status; stderr
+        # goes to ours so tool errors stay visible.
+        script = (line + b" >/dev/null & echo " + self._PID_MARKER + b" $!; "
+                  b"wait $!; echo " + self._STATUS_MARKER + b" $?\n")
+
+        with self._lock:
+            if not self._is_running():
+                try:
+                    self._start()
+                except OSError:
+                    return False
+
+            try:
+                self._stdin.write(script)
+                self._stdin.flush()
+            except OSError:
+                self._stop()
+                return False
+
+            deadline = time.monotonic() + timeout
+            cmd_pid = self._read_value(self._PID_MARKER, deadline)
+            status = None
+            if cmd_pid is not None:
+                status = self._read_value(self._STATUS_MARKER, deadline)
+                if status is None:
+                    # Kill only the command that timed out - clipboard tools
+                    # started earlier keep running in the background to
+                    # serve the clipboard and must survive
+                    try:
+                        os.kill(cmd_pid, signal.SIGKILL)
+                    except OSError:
+                        pass
+                    # The shell's wait returns now; consume its status line
+                    if self._read_value(self._STATUS_MARKER, time.monotonic() + 1) is not None:
+                        return False
+
+            if status is None:
+                # Shell hung or died - the next call starts a fresh one
+                self._stop()
+                return False
+            return status == 0
+
+    @staticmethod
+    def _quote(data: bytes) -> bytes:
+        """Single-quote raw bytes for the shell (bytes counterpart of shlex.quote)"""
+        return b"'" + data.replace(b"'", b"'\\''") + b"'"
+
+    def _start(self):
+        """Spawn the helper shell in its own session, detached from our terminal"""
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        try:
+            self._pid = os.posix_spawn(
+                '/bin/sh', ['/bin/sh'], os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, stdin_read, 0),
+                    (os.POSIX_SPAWN_DUP2, stdout_write, 1),
+                    (os.POSIX_SPAWN_DUP2, 2, 2),
+                ],
+                setsid=True
+            )
+        except OSError:
+            os.close(stdin_write)
+            os.close(stdout_read)
+            raise
+        finally:
+            # Child has its own copies (pipe fds are close-on-exec otherwise)
+            os.close(stdin_read)
+            os.close(stdout_write)
+
+        self._stdin = os.fdopen(stdin_write, 'wb')
+        self._stdout_fd = stdout_read
+
+    def _is_running(self) -> bool:
+        """Check whether the helper shell is alive, cleaning up if it exited"""
+        if self._pid is None:
+            return False
+        try:
+            pid, _ = os.waitpid(self._pid, os.WNOHANG)
+        except ChildProcessError:
+            pid = self._pid
+        if pid == 0:
+            return True
+        self._pid = None
+        self._close_pipes()
+        return False
+
+    def _read_value(self, marker: bytes, deadline: float) -> Optional[int]:
+        """Read the next "<marker> <number>" line, or None on timeout/EOF/garbage"""
+        while b'\n' not in self._output:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._stdout_fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(self._stdout_fd, 64)
+            if not chunk:
+                return None
+            self._output += chunk
+
+        line, _, self._output = self._output.partition(b'\n')
+        line_marker, _, value = line.strip().partition(b' ')
+        if line_marker != marker or not value.isdigit():
+            return None
+        return int(value)
+
+    def _stop(self):
+        """Kill the helper shell and anything it is still running"""
+        if self._pid is None:
+            return
+        try:
+            # Only the shell itself: background clipboard holders it started
+            # share its process group and must keep running
+            os.kill(self._pid, signal.SIGKILL)
+        except OSError:
+            pass
+        try:
+            os.waitpid(self._pid, 0)
+        except ChildProcessError:
+            pass
+        self._pid = None
+        self._close_pipes()
+
+    def _close_pipes(self):
+        """Close our ends of the helper shell's pipes"""
+        self._output = b''
+        if self._stdin is not None:
+            try:
+                self._stdin.close()
+            except OSError:
+                # Unflushed data on a broken pipe
+                pass
+            self._stdin = None
+        if self._stdout_fd is not None:
+            os.close(self._stdout_fd)
+            self._stdout_fd = None
+
 
 class PlatformInfo:
     """Container for platform detection results"""
 
     def __init__(self):
-        self.display_server = self._detect_display_server()
-        self.desktop_env = self._detect_desktop_environment()
-        self.is_wayland = self.display_server == 'wayland'
-        self.is_x11 = self.display_server == 'x11'
-        self.is_kde = 'kde' in self.desktop_env.lower()
-        self.is_gnome = 'gnome' in self.desktop_env.lower()
-
-        # Detect available tools
-        self.available_tools = self._detect_available_tools()
+        self._ydotool_socket = None  # Connected ydotoold socket, cached once opened
+        # Serializes key sends so events from concurrent callers never
+        # interleave and a reconnect cannot pull the socket from under a send
+        self._ydotool_lock = threading.Lock()
+
+    # Detection runs lazily: each attribute is computed on first access and
+    # memoized on the instance, so callers only pay for what they use.
+
+    @functools.cached_property
+    def display_server(self) -> str:
+        """Display server: wayland, x11 or unknown"""
+        return self._detect_display_server()
+
+    @functools.cached_property
+    def desktop_env(self) -> str:
+        """Desktop environment name (e.g. KDE, GNOME)"""
+        return self._detect_desktop_environment()
+
+    @functools.cached_property
+    def is_wayland(self) -> bool:
+        """True when running under Wayland"""
+        return self.display_server == 'wayland'
+
+    @functools.cached_property
+    def is_x11(self) -> bool:
+        """True when running under X11"""
+        return self.display_server == 'x11'
+
+    @functools.cached_property
+    def is_kde(self) -> bool:
+        """True when running under KDE Plasma"""
+        return 'kde' in self.desktop_env.lower()
+
+    @functools.cached_property
+    def is_gnome(self) -> bool:
+        """True when running under GNOME"""
+        return 'gnome' in self.desktop_env.lower()
+
+    @functools.cached_property
+    def available_tools(self) -> Dict[str, List[str]]:
+        """Tools found in PATH, grouped by category"""
+        return self._detect_available_tools()
+
+    @functools.cached_property
+    def _shell(self) -> _ShellHelper:
+        """Helper shell used to run clipboard/keyboard tools (started on first use)"""
+        return _ShellHelper()
 
     def _detect_display_server(self) -> str:
         """Detect if running Wayland or X11"""
@@ -101,10 +388,11 @@ class PlatformInfo:
 
     def _has_command(self, cmd: str) -> bool:
         """Check if a command is available in PATH"""
-        return shutil.which(cmd) is not None
+        return _fast_which(cmd) is not None
 
-    def get_clipboard_tool(self) -> Optional[str]:
-        """Get the best clipboard tool for current environment"""
+    @functools.cached_property
+    def clipboard_tool(self) -> Optional[str]:
+        """Best clipboard tool for current environment"""
         if self.is_wayland and 'wl-clipboard' in self.available_tools['clipboard']:
             return 'wl-clipboard'
         elif self.is_x11:
@@ -118,8 +406,9 @@ class PlatformInfo:
 
         return None
 
-    def get_keyboard_tool(self) -> Optional[str]:
-        """Get the best keyboard automation tool for current environment"""
+    @functools.cached_property
+    def keyboard_tool(self) -> Optional[str]:
+        """Best keyboard automation tool for current environment"""
         # Prefer ydotool as it works everywhere
         if 'ydotool' in self.available_tools['keyboard']:
             return 'ydotool'
@@ -140,38 +429,24 @@ class PlatformInfo:
 
     def copy_to_clipboard(self, text: str) -> bool:
         """Copy text to clipboard using best available tool"""
-        clipboard_tool = self.get_clipboard_tool()
+        return self._copy_impl(text.encode())
 
-        if not clipboard_tool:
-            return False
+    def _copy_impl(self, data: bytes) -> bool:
+        """Pipe raw bytes into the best available clipboard tool"""
+        clipboard_tool = self.clipboard_tool
 
-        try:
-            if clipboard_tool == 'wl-clipboard':
-                subprocess.run(['wl-copy', text], check=True, timeout=5)
-            elif clipboard_tool == 'xclip':
-                subprocess.run(
-                    ['xclip', '-selection', 'clipboard'],
-                    input=text.encode(),
-                    check=True,
-                    timeout=5
-                )
-            elif clipboard_tool == 'xsel':
-                subprocess.run(
-                    ['xsel', '--clipboard', '--input'],
-                    input=text.encode(),
-                    check=True,
-                    timeout=5
-                )
-            else:
-                return False
+        if clipboard_tool == 'wl-clipboard':
+            return self._shell.run(['wl-copy'], data, timeout=5)
+        elif clipboard_tool == 'xclip':
+            return self._shell.run(['xclip', '-selection', 'clipboard'], data, timeout=5)
+        elif clipboard_tool == 'xsel':
+            return self._shell.run(['xsel', '--clipboard', '--input'], data, timeout=5)
 
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return False
 
     def paste_from_clipboard(self) -> Optional[str]:
         """Paste text from clipboard using best available tool"""
-        clipboard_tool = self.get_clipboard_tool()
+        clipboard_tool = self.clipboard_tool
 
         if not clipboard_tool:
             return None
@@ -210,27 +485,20 @@ class PlatformInfo:
 
     def type_text(self, text: str) -> bool:
         """Type text using best available keyboard automation tool"""
-        keyboard_tool = self.get_keyboard_tool()
+        keyboard_tool = self.keyboard_tool
+        data = text.encode()
 
-        if not keyboard_tool:
-            return False
+        if keyboard_tool == 'ydotool':
+            # ydotool requires text to be typed character by character
+            return self._shell.run(['ydotool', 'type'], data, data_as_arg=True, timeout=10)
+        elif keyboard_tool == 'kdotool':
+            return self._shell.run(['kdotool', 'type'], data, data_as_arg=True, timeout=10)
+        elif keyboard_tool == 'xdotool':
+            return self._shell.run(['xdotool', 'type', '--'], data, data_as_arg=True, timeout=10)
+        elif keyboard_tool == 'wtype':
+            return self._shell.run(['wtype'], data, data_as_arg=True, timeout=10)
 
-        try:
-            if keyboard_tool == 'ydotool':
-                # ydotool requires text to be typed character by character
-                subprocess.run(['ydotool', 'type', text], check=True, timeout=10)
-            elif keyboard_tool == 'kdotool':
-                subprocess.run(['kdotool', 'type', text], check=True, timeout=10)
-            elif keyboard_tool == 'xdotool':
-                subprocess.run(['xdotool', 'type', '--', text], check=True, timeout=10)
-            elif keyboard_tool == 'wtype':
-                subprocess.run(['wtype', text], check=True, timeout=10)
-            else:
-                return False
-
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+        return False
 
     def simulate_paste_shortcut(self, use_shift: bool = False) -> bool:
         """
@@ -239,45 +507,78 @@ class PlatformInfo:
         Args:
             use_shift: If True, use Shift+Ctrl+V (for terminals), else Ctrl+V (GUI apps)
         """
-        keyboard_tool = self.get_keyboard_tool()
+        keyboard_tool = self.keyboard_tool
 
         if keyboard_tool != 'ydotool':
             # Only ydotool supports key simulation reliably
             return False
 
-        try:
-            if use_shift:
-                # Shift+Ctrl+V for terminals
-                subprocess.run(
-                    ['ydotool', 'key',
-                     f'{YDOTOOL_KEY_LEFT_SHIFT}:1', f'{YDOTOOL_KEY_LEFT_CTRL}:1', f'{YDOTOOL_KEY_V}:1',
-                     f'{YDOTOOL_KEY_V}:0', f'{YDOTOOL_KEY_LEFT_CTRL}:0', f'{YDOTOOL_KEY_LEFT_SHIFT}:0'],
-                    check=True,
-                    timeout=2
-                )
-            else:
-                # Ctrl+V for GUI apps
-                subprocess.run(
-                    ['ydotool', 'key',
-                     f'{YDOTOOL_KEY_LEFT_CTRL}:1', f'{YDOTOOL_KEY_V}:1',
-                     f'{YDOTOOL_KEY_V}:0', f'{YDOTOOL_KEY_LEFT_CTRL}:0'],
-                    check=True,
-                    timeout=2
-                )
-
+        if use_shift:
+            # Shift+Ctrl+V for terminals
+            chord = [YDOTOOL_KEY_LEFT_SHIFT, YDOTOOL_KEY_LEFT_CTRL, YDOTOOL_KEY_V]
+        else:
+            # Ctrl+V for GUI apps
+            chord = [YDOTOOL_KEY_LEFT_CTRL, YDOTOOL_KEY_V]
+        # Press keys in order, release in reverse order
+        key_events = [(code, 1) for code in chord] + [(code, 0) for code in reversed(chord)]
+
+        # Fast path: talk to ydotoold directly instead of spawning the client
+        if self._send_ydotool_keys(key_events):
             return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            return False
+
+        keys = [f'{code}:{value}' for code, value in key_events]
+        return self._shell.run(['ydotool', 'key'] + keys, timeout=2)
+
+    def _send_ydotool_keys(self, key_events: List[tuple]) -> bool:
+        """Send (keycode, value) events straight to the ydotoold socket"""
+        with self._ydotool_lock:
+            if self._ydotool_socket is None:
+                self._ydotool_socket = self._connect_ydotool_socket()
+                if self._ydotool_socket is None:
+                    return False
+
+            try:
+                for index, (code, value) in enumerate(key_events):
+                    if index:
+                        time.sleep(YDOTOOL_KEY_DELAY)
+                    self._ydotool_socket.send(_INPUT_EVENT.pack(0, 0, _EV_KEY, code, value))
+                    self._ydotool_socket.send(_INPUT_EVENT.pack(0, 0, _EV_SYN, _SYN_REPORT, 0))
+                return True
+            except OSError:
+                # Daemon went away (e.g. restarted) - reconnect on the next call
+                self._ydotool_socket.close()
+                self._ydotool_socket = None
+                return False
+
+    def _connect_ydotool_socket(self) -> Optional[socket.socket]:
+        """Connect to ydotoold's socket, or None if it is not reachable"""
+        candidates = []
+        if os.environ.get('YDOTOOL_SOCKET'):
+            candidates.append(os.environ['YDOTOOL_SOCKET'])
+        if os.environ.get('XDG_RUNTIME_DIR'):
+            candidates.append(os.path.join(os.environ['XDG_RUNTIME_DIR'], '.ydotool_socket'))
+        candidates.append(YDOTOOL_SOCKET_FALLBACK)
+
+        for path in candidates:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            # Never hang the caller on a stuck daemon with a full queue
+            sock.settimeout(2)
+            try:
+                sock.connect(path)
+                return sock
+            except OSError:
+                # Missing socket, or an older ydotool speaking another protocol
+                sock.close()
+        return None
 
     def get_install_instructions(self) -> str:
         """Get installation instructions for missing tools"""
-        # Detect distribution
-        distro = self._detect_distro()
+        distro = self.distro
 
         instructions = []
 
         # Check for missing clipboard tools
-        clipboard_tool = self.get_clipboard_tool()
+        clipboard_tool = self.clipboard_tool
         if not clipboard_tool:
             if self.is_wayland:
                 instructions.append(f"Install clipboard tool: {self._get_package_cmd(distro, 'wl-clipboard')}")
@@ -285,7 +586,7 @@ class PlatformInfo:
                 instructions.append(f"Install clipboard tool: {self._get_package_cmd(distro, 'xclip')}")
 
         # Check for missing keyboard tools
-        keyboard_tool = self.get_keyboard_tool()
+        keyboard_tool = self.keyboard_tool
         if not keyboard_tool:
             instructions.append(f"Install keyboard automation: {self._get_package_cmd(distro, 'ydotool')}")
             if keyboard_tool == 'ydotool':
@@ -296,24 +597,25 @@ class PlatformInfo:
 
         return "\n".join(instructions)
 
-    def _detect_distro(self) -> str:
-        """Detect Linux distribution"""
+    @functools.cached_property
+    def distro(self) -> str:
+        """Linux distribution family: arch, debian, fedora, opensuse or unknown"""
         try:
-            # Try to read /etc/os-release
+            # Single read of /etc/os-release into a KEY -> value dict
             with open('/etc/os-release', 'r') as f:
-                for line in f:
-                    if line.startswith('ID='):
-                        distro_id = line.split('=')[1].strip().strip('"').lower()
-                        if distro_id in ('arch', 'manjaro', 'cachyos'):
-                            return 'arch'
-                        elif distro_id in ('ubuntu', 'debian', 'pop', 'mint'):
-                            return 'debian'
-                        elif distro_id in ('fedora', 'rhel', 'centos'):
-                            return 'fedora'
-                        elif distro_id in ('opensuse', 'sles'):
-                            return 'opensuse'
-        except FileNotFoundError:
-            pass
+                os_release = dict(line.rstrip('\n').split('=', 1) for line in f if '=' in line)
+        except OSError:
+            return 'unknown'
+
+        distro_id = os_release.get('ID', '').strip().strip('"').lower()
+        if distro_id in ('arch', 'manjaro', 'cachyos'):
+            return 'arch'
+        elif distro_id in ('ubuntu', 'debian', 'pop', 'mint'):
+            return 'debian'
+        elif distro_id in ('fedora', 'rhel', 'centos'):
+            return 'fedora'
+        elif distro_id in ('opensuse', 'sles'):
+            return 'opensuse'
 
         return 'unknown'
 
@@ -355,21 +657,101 @@ class PlatformInfo:
 
     def print_info(self):
         """Print detected platform information"""
-        print("=" * 60)
-        print("Platform Detection Results")
-        print("=" * 60)
-        print(f"Display Server: {self.display_server}")
-        print(f"Desktop Environment: {self.desktop_env}")
-        print(f"")
-        print("Available Tools:")
-        print(f"  Clipboard: {', '.join(self.available_tools['clipboard']) or 'None'}")
-        print(f"  Keyboard: {', '.join(self.available_tools['keyboard']) or 'None'}")
-        print(f"  Notification: {', '.join(self.available_tools['notification']) or 'None'}")
-        print(f"")
-        print("Selected Tools:")
-        print(f"  Clipboard: {self.get_clipboard_tool() or 'None available'}")
-        print(f"  Keyboard: {self.get_keyboard_tool() or 'None available'}")
-        print("=" * 60)
+        tools = self.available_tools
+        sys.stdout.write('\n'.join([
+            "=" * 60,
+            "Platform Detection Results",
+            "=" * 60,
+            "Display Server: " + self.display_server,
+            "Desktop Environment: " + self.desktop_env,
+            "",
+            "Available Tools:",
+            "  Clipboard: " + (', '.join(tools['clipboard']) or 'None'),
+            "  Keyboard: " + (', '.join(tools['keyboard']) or 'None'),
+            "  Notification: " + (', '.join(tools['notification']) or 'None'),
+            "",
+            "Selected Tools:",
+            "  Clipboard: " + (self.clipboard_tool or 'None available'),
+            "  Keyboard: " + (self.keyboard_tool or 'None available'),
+            "=" * 60,
+            "",
+        ]))
+
+
+def _platform_cache_key() -> str:
+    """Hash of the environment the detection results depend on"""
+    parts = [str(PLATFORM_CACHE_VERSION)]
+    parts += [os.environ.get(var, '') for var in (
+        'PATH', 'XDG_SESSION_TYPE', 'XDG_CURRENT_DESKTOP', 'DESKTOP_SESSION',
+        'WAYLAND_DISPLAY', 'DISPLAY', 'KDE_FULL_SESSION', 'GNOME_DESKTOP_SESSION_ID'
+    )]
+    # Installing or removing a tool touches its directory, so PATH directory
+    # mtimes invalidate the cache without rescanning the directories
+    for path_dir in os.environ.get('PATH', '').split(os.pathsep):
+        try:
+            parts.append(str(os.stat(path_dir).st_mtime_ns))
+        except OSError:
+            parts.append('')
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+
+def _load_cached_platform_info(key: str) -> Optional[PlatformInfo]:
+    """Restore PlatformInfo from the cache file if it is fresh and matches key"""
+    try:
+        if time.time() - os.path.getmtime(PLATFORM_CACHE_FILE) > PLATFORM_CACHE_TTL:
+            return None
+        with open(PLATFORM_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get('key') != key:
+        return None
+    if not _is_valid_cached_platform_data(data):
+        # Corrupt or hand-edited file - treat it as a cache miss
+        return None
+
+    # Bypass detection entirely: pre-populate the cached properties
+    info = PlatformInfo()
+    for attr in _CACHED_ATTRIBUTES:
+        setattr(info, attr, data[attr])
+    return info
+
+
+def _is_valid_cached_platform_data(data: dict) -> bool:
+    """Check the cached attributes have the shape detection would produce"""
+    for attr in ('display_server', 'desktop_env', 'distro'):
+        if not isinstance(data.get(attr), str):
+            return False
+    tools = data.get('available_tools')
+    if not isinstance(tools, dict):
+        return False
+    for category in ('clipboard', 'keyboard', 'notification'):
+        names = tools.get(category)
+        if not isinstance(names, list) or not all(isinstance(n, str) for n in names):
+            return False
+    return True
+
+
+def _save_cached_platform_info(info: PlatformInfo, key: str) -> None:
+    """Atomically write detection results to the cache file"""
+    data = {'key': key}
+    data.update({attr: getattr(info, attr) for attr in _CACHED_ATTRIBUTES})
+
+    cache_dir = os.path.dirname(PLATFORM_CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, PLATFORM_CACHE_FILE)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # Cache is an optimization only - never fail detection because of it
+        pass
 
 
 # Global instance for easy access
@@ -377,10 +759,14 @@ _platform_info = None
 
 
 def get_platform_info() -> PlatformInfo:
-    """Get singleton PlatformInfo instance"""
+    """Get singleton PlatformInfo instance (backed by an on-disk cache)"""
     global _platform_info
     if _platform_info is None:
-        _platform_info = PlatformInfo()
+        key = _platform_cache_key()
+        _platform_info = _load_cached_platform_info(key)
+        if _platform_info is None:
+            _platform_info = PlatformInfo()
+            _save_cached_platform_info(_platform_info, key)
     return _platform_info
 
 
@@ -8,14 +8,10 @@ import sys
 import os
 import subprocess
 import threading
-import queue
 import time
 import numpy as np
 import sounddevice as sd
-import scipy.io.wavfile as wav
-import tempfile
-import requests
-from .voice_to_claude import VoiceTranscriber, SAMPLE_RATE, WHISPER_URL
+from .voice_to_claude import VoiceTranscriber, SAMPLE_RATE, WHISPER_URL, check_server_health
 from .platform_detect import get_platform_info
 import evdev
 from evdev import ecodes
@@ -39,13 +35,15 @@ BEEP_DURATION = 0.1  # seconds
 CLIPBOARD_PASTE_DELAY = 0.15  # seconds - Wait after clipboard copy before paste
 NOTIFICATION_PREVIEW_LENGTH = 50  # characters - Preview length in notifications
 NOTIFICATION_TIMEOUT = 5000  # milliseconds
+RECORDING_BUFFER_SECONDS = 30  # Initial recording buffer size (grows if exceeded)
 
 
 class StreamingRecorder:
     """Records audio with dynamic start/stop capability"""
 
     def __init__(self):
-        self.audio_queue = queue.Queue()
+        self.buffer = None  # Pre-allocated int16 sample buffer, filled by callback
+        self.frames_recorded = 0
         self.stream = None
         self.is_recording = False
         self.start_time = None
@@ -55,9 +53,11 @@ class StreamingRecorder:
         if self.is_recording:
             return
 
-        # Clear any old data
-        while not self.audio_queue.empty():
-            self.audio_queue.get()
+        # Fresh buffer per recording: the previous one may still be in use
+        # by a background transcription thread (see stop())
+        if self.buffer is None:
+            self.buffer = np.empty((RECORDING_BUFFER_SECONDS * SAMPLE_RATE, 1), dtype=np.int16)
+        self.frames_recorded = 0
 
         self.is_recording = True
         self.start_time = time.time()
@@ -92,24 +92,30 @@ class StreamingRecorder:
             print(f"Recording too short ({duration:.2f}s), ignoring...")
             return None
 
-        # Collect all audio chunks
-        audio_chunks = []
-        while not self.audio_queue.empty():
-            audio_chunks.append(self.audio_queue.get())
-
-        if not audio_chunks:
+        if not self.frames_recorded:
             return None
 
-        # Concatenate all chunks
-        audio_data = np.concatenate(audio_chunks, axis=0)
+        # Hand the filled part of the buffer to the caller without copying;
+        # the next recording allocates a new buffer
+        audio_data = self.buffer[:self.frames_recorded]
+        self.buffer = None
         return audio_data
 
     def _audio_callback(self, indata, frames, time_info, status):
         """Callback function for audio stream"""
         if status:
             print(f"Audio status: {status}", file=sys.stderr)
-        if self.is_recording:
-            self.audio_queue.put(indata.copy())
+        if not self.is_recording:
+            return
+
+        end = self.frames_recorded + frames
+        if end > len(self.buffer):
+            # Recording outgrew the buffer - double it (rare for speech input)
+            grown = np.empty((max(end, 2 * len(self.buffer)), 1), dtype=np.int16)
+            grown[:self.frames_recorded] = self.buffer[:self.frames_recorded]
+            self.buffer = grown
+        self.buffer[self.frames_recorded:end] = indata
+        self.frames_recorded = end
 
 
 class HoldToSpeakDaemon:
@@ -130,12 +136,8 @@ class HoldToSpeakDaemon:
         Returns True if server is available, False otherwise.
         """
         # Check if server is already running
-        try:
-            response = requests.get(WHISPER_URL.replace('/v1/audio/transcriptions', '/health'), timeout=2)
-            if response.status_code == 200:
-                return True
-        except (requests.ConnectionError, requests.Timeout):
-            pass
+        if check_server_health(timeout=2):
+            return True
 
         # Server not running, try to start it
         print("⚠ whisper server not running. Attempting to start local server...")
@@ -154,13 +156,10 @@ class HoldToSpeakDaemon:
                 # Wait for server to become available (up to 20 seconds)
                 print("⏳ Waiting for whisper server to start...")
                 for i in range(40):  # 40 attempts * 0.5s = 20 seconds max
-                    try:
-                        response = requests.get(WHISPER_URL.replace('/v1/audio/transcriptions', '/health'), timeout=1)
-                        if response.status_code == 200:
-                            print("✓ whisper server started successfully!")
-                            return True
-                    except (requests.ConnectionError, requests.Timeout):
-                        time.sleep(0.5)
+                    if check_server_health(timeout=1):
+                        print("✓ whisper server started successfully!")
+                        return True
+                    time.sleep(0.5)
 
                 print("✗ Server not responding after 20 seconds")
                 return False
@@ -294,11 +293,14 @@ class HoldToSpeakDaemon:
 
         elif event.value == 0:  # Key released
             print("⏹️  Recording stopped")
-            self.play_beep(sound_file=BEEP_STOP_SOUND, frequency=BEEP_STOP_FREQUENCY, duration=BEEP_DURATION)
 
             # Stop recording and get audio data
             audio_data = self.recorder.stop()
 
+            # Beep in background - playback must not delay transcription
+            self._run_in_background(self.play_beep, sound_file=BEEP_STOP_SOUND,
+                                    frequency=BEEP_STOP_FREQUENCY, duration=BEEP_DURATION)
+
             if audio_data is not None:
                 # Update notification to show transcribing status
                 self.show_notification('Voice Input', 'Transcribing...',
@@ -314,6 +316,10 @@ class HoldToSpeakDaemon:
                 self.show_notification('Voice Input', 'Recording too short',
                                      icon='dialog-warning', timeout=3000)
 
+    def _run_in_background(self, target, *args, **kwargs):
+        """Run a fire-and-forget helper (e.g. a beep) in a daemon thread"""
+        threading.Thread(target=target, args=args, kwargs=kwargs, daemon=True).start()
+
     def _transcribe_and_type(self, audio_data):
         """Transcribe audio and type the result"""
         try:
@@ -346,8 +352,8 @@ class HoldToSpeakDaemon:
         print("Hold-to-Speak Voice Input Daemon")
         print("="*60)
         print(f"Platform: {self.platform.display_server.upper()}/{self.platform.desktop_env}")
-        print(f"Clipboard: {self.platform.get_clipboard_tool() or 'None'}")
-        print(f"Keyboard: {self.platform.get_keyboard_tool() or 'None'}")
+        print(f"Clipboard: {self.platform.clipboard_tool or 'None'}")
+        print(f"Keyboard: {self.platform.keyboard_tool or 'None'}")
         print(f"Trigger key: F12")
         print(f"Whisper server: {WHISPER_URL}")
         print(f"Minimum recording: {MIN_RECORDING_DURATION}s")
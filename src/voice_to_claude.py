@@ -3,40 +3,141 @@
 Voice-to-Claude-CLI: Local voice transcription using whisper.cpp
 """
 import os
+import struct
 import sys
-import tempfile
+import time
 from typing import Optional
 import numpy as np
 import numpy.typing as npt
 import requests
+from requests.adapters import HTTPAdapter
 import sounddevice as sd
-import scipy.io.wavfile as wav
+try:
+    import orjson as json  # Parses straight from bytes, no intermediate str
+except ImportError:  # venvs created before orjson was added to requirements.txt
+    import json
 
 # Configuration
 SAMPLE_RATE = 16000  # Whisper expects 16kHz audio
 DURATION = 5  # Default recording duration in seconds
 WHISPER_URL = "http://127.0.0.1:2022/v1/audio/transcriptions"
+WHISPER_HEALTH_URL = "http://127.0.0.1:2022/health"
+
+# 44-byte RIFF/WAV header for 16kHz mono int16 PCM. Only the RIFF chunk size
+# (offset 4) and data chunk size (offset 40) vary, patched in per recording.
+_WAV_HEADER = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0, b'WAVE',
+    b'fmt ', 16, 1, 1, SAMPLE_RATE, SAMPLE_RATE * 2, 2, 16,  # PCM, mono, 16-bit
+    b'data', 0
+)
+
+# whisper.cpp only accepts audio as a multipart form upload, so the form is
+# assembled by hand around the WAV bytes instead of via requests' encoder
+_MULTIPART_BOUNDARY = os.urandom(16).hex()
+_MULTIPART_CONTENT_TYPE = f"multipart/form-data; boundary={_MULTIPART_BOUNDARY}"
+_MULTIPART_PREAMBLE = (
+    f"--{_MULTIPART_BOUNDARY}\r\n"
+    'Content-Disposition: form-data; name="model"\r\n\r\n'
+    "whisper-1\r\n"  # Required by OpenAI-compatible API
+    f"--{_MULTIPART_BOUNDARY}\r\n"
+    'Content-Disposition: form-data; name="file"; filename="audio.wav"\r\n'
+    "Content-Type: audio/wav\r\n\r\n"
+).encode()
+_MULTIPART_EPILOGUE = f"\r\n--{_MULTIPART_BOUNDARY}--\r\n".encode()
+
+# Shared keep-alive session for all whisper.cpp traffic (health checks and
+# transcriptions): subsequent requests reuse the pooled connection
+_SESSION = requests.Session()
+_SESSION.mount("http://127.0.0.1:2022", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
+# Remember a successful health check briefly so back-to-back invocations
+# (e.g. repeated hotkey presses) skip the HTTP round-trip
+HEALTH_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_RUNTIME_DIR') or f"/run/user/{os.getuid()}",
+    'voice_to_claude.health'
+)
+HEALTH_CACHE_TTL = 10  # seconds
+
+
+def check_server_health(timeout: float = 2) -> bool:
+    """Probe the whisper.cpp /health endpoint (uncached).
+
+    Args:
+        timeout: Seconds to wait for the server to answer
+
+    Returns:
+        True if the server answered with status 200
+    """
+    try:
+        response = _SESSION.get(WHISPER_HEALTH_URL, timeout=timeout)
+        return response.status_code == 200
+    except requests.exceptions.RequestException:
+        return False
+
+
+def _check_health_cached() -> bool:
+    """Check whisper.cpp server health, reusing a recent successful result.
+
+    Returns:
+        True if the server is (recently known to be) healthy
+    """
+    try:
+        if time.time() - os.path.getmtime(HEALTH_CACHE_FILE) < HEALTH_CACHE_TTL:
+            return True
+    except OSError:
+        pass
+
+    healthy = check_server_health(timeout=2)
+
+    try:
+        if healthy:
+            # Touch the marker file; its mtime is the timestamp
+            with open(HEALTH_CACHE_FILE, 'a'):
+                os.utime(HEALTH_CACHE_FILE)
+        else:
+            os.unlink(HEALTH_CACHE_FILE)
+    except OSError:
+        # Runtime dir missing or marker already gone - caching is best-effort
+        pass
+
+    return healthy
+
+
+class WhisperServerDown(ConnectionError):
+    """Raised when the whisper.cpp server is not reachable."""
+
+
+def print_server_help() -> None:
+    """Print instructions for starting the whisper.cpp server."""
+    print("✗ Error: whisper.cpp server is not running on port 2022")
+    print("\nPlease start the whisper server:")
+    print("cd /tmp/whisper.cpp")
+    print("./build/bin/whisper-server --model models/ggml-base.en.bin \\")
+    print("  --host 127.0.0.1 --port 2022 \\")
+    print("  --inference-path '/v1/audio/transcriptions' \\")
+    print("  --threads 4 --processors 1 --convert --print-progress")
 
 
 class VoiceTranscriber:
     def __init__(self) -> None:
-        """Initialize VoiceTranscriber and verify whisper.cpp server connection."""
-        # Check if whisper.cpp server is running
-        try:
-            response = requests.get("http://127.0.0.1:2022/health", timeout=2)
-            if response.status_code == 200:
-                print("✓ Connected to whisper.cpp server")
-            else:
-                raise ConnectionError("Whisper server returned unexpected status")
-        except requests.exceptions.RequestException:
-            print("✗ Error: whisper.cpp server is not running on port 2022")
-            print("\nPlease start the whisper server:")
-            print("cd /tmp/whisper.cpp")
-            print("./build/bin/whisper-server --model models/ggml-base.en.bin \\")
-            print("  --host 127.0.0.1 --port 2022 \\")
-            print("  --inference-path '/v1/audio/transcriptions' \\")
-            print("  --threads 4 --processors 1 --convert --print-progress")
-            sys.exit(1)
+        """Initialize VoiceTranscriber.
+
+        No server connection is made here; the whisper.cpp server is checked
+        by transcribe_audio, or up front by calling ensure_server().
+        """
+        # Recording buffer owned by us, allocated by the first record_audio()
+        # call and reused (grown if needed) by later ones
+        self._audio_buf: Optional[npt.NDArray[np.int16]] = None
+
+    def ensure_server(self) -> None:
+        """Verify the whisper.cpp server is reachable (cached for a few seconds).
+
+        Raises:
+            WhisperServerDown: If the server does not answer the health check
+        """
+        if not _check_health_cached():
+            raise WhisperServerDown("whisper.cpp server is not running on port 2022")
 
     def record_audio(self, duration: int = DURATION) -> npt.NDArray[np.int16]:
         """Record audio from microphone.
@@ -45,13 +146,16 @@ class VoiceTranscriber:
             duration: Recording duration in seconds
 
         Returns:
-            Audio data as 16kHz mono int16 numpy array
+            Audio data as 16kHz mono int16 numpy array. This is a view into
+            the transcriber's reusable buffer, valid until the next call.
         """
+        frames = int(duration * SAMPLE_RATE)
+        if self._audio_buf is None or frames > len(self._audio_buf):
+            self._audio_buf = np.empty((frames, 1), dtype=np.int16)
+        audio_data = self._audio_buf[:frames]
+
         print(f"\nRecording for {duration} seconds... Speak now!")
-        audio_data = sd.rec(int(duration * SAMPLE_RATE),
-                           samplerate=SAMPLE_RATE,
-                           channels=1,
-                           dtype='int16')
+        sd.rec(out=audio_data, samplerate=SAMPLE_RATE)
         sd.wait()  # Wait until recording is finished
         print("Recording finished!")
         return audio_data
@@ -64,31 +168,35 @@ class VoiceTranscriber:
 
         Returns:
             Transcribed text, or empty string on failure
+
+        Raises:
+            WhisperServerDown: If the whisper.cpp server is not reachable
         """
-        # Save audio to temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            wav.write(tmp_file.name, SAMPLE_RATE, audio_data)
-            tmp_filename = tmp_file.name
+        self.ensure_server()
+
+        # Encode audio as WAV in memory from the pre-built header
+        pcm = np.ascontiguousarray(audio_data, dtype=np.int16)
+        header = bytearray(_WAV_HEADER)
+        struct.pack_into('<I', header, 4, 36 + pcm.nbytes)
+        struct.pack_into('<I', header, 40, pcm.nbytes)
+        # Single copy of the samples: straight from the array into the body
+        body = b''.join((_MULTIPART_PREAMBLE, header, pcm, _MULTIPART_EPILOGUE))
 
         try:
             # Transcribe using whisper.cpp server
             print("Transcribing...")
-            with open(tmp_filename, 'rb') as audio_file:
-                files = {'file': ('audio.wav', audio_file, 'audio/wav')}
-                data = {'model': 'whisper-1'}  # Required by OpenAI-compatible API
+            response = _SESSION.post(WHISPER_URL, data=body,
+                                     headers={'Content-Type': _MULTIPART_CONTENT_TYPE},
+                                     timeout=30)
+            response.raise_for_status()
 
-                response = requests.post(WHISPER_URL, files=files, data=data, timeout=30)
-                response.raise_for_status()
-
-                result = response.json()
-                transcribed_text = result.get("text", "").strip()
-                return transcribed_text
-        except requests.exceptions.RequestException as e:
+            # Parse the raw body directly, skipping requests' text decoding
+            result = json.loads(response.content)
+            transcribed_text = result.get("text", "").strip()
+            return transcribed_text
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error transcribing audio: {e}")
             return ""
-        finally:
-            # Clean up temporary file
-            os.unlink(tmp_filename)
 
     def run_interactive(self) -> None:
         """Run interactive voice transcription session in terminal."""
@@ -130,6 +238,8 @@ class VoiceTranscriber:
             except KeyboardInterrupt:
                 print("\n\nSession interrupted. Goodbye!")
                 break
+            except WhisperServerDown:
+                raise
             except Exception as e:
                 print(f"\nError: {e}")
                 print("Please try again.")
@@ -139,7 +249,13 @@ def main() -> None:
     """Main entry point for interactive voice transcription."""
     try:
         transcriber = VoiceTranscriber()
+        # Fail before the first recording rather than after it
+        transcriber.ensure_server()
+        print("✓ Connected to whisper.cpp server")
         transcriber.run_interactive()
+    except WhisperServerDown:
+        print_server_help()
+        sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}")
         sys.exit(1)
@@ -9,7 +9,7 @@ Prerequisites:
 """
 import sys
 import subprocess
-from .voice_to_claude import VoiceTranscriber, DURATION
+from .voice_to_claude import VoiceTranscriber, WhisperServerDown, print_server_help, DURATION
 from .platform_detect import get_platform_info
 
 
@@ -42,7 +42,7 @@ def main():
     platform = get_platform_info()
 
     # Check if we have typing or clipboard tools
-    if not platform.get_keyboard_tool() and not platform.get_clipboard_tool():
+    if not platform.keyboard_tool and not platform.clipboard_tool:
         print("✗ Error: No keyboard automation or clipboard tool available")
         print("\nPlease install required tools:")
         print(platform.get_install_instructions())
@@ -51,7 +51,7 @@ def main():
     print("="*60)
     print(f"Voice-to-Text Input ({platform.display_server.upper()}/{platform.desktop_env})")
     print("="*60)
-    print(f"Using: {platform.get_keyboard_tool() or 'clipboard'} for text input")
+    print(f"Using: {platform.keyboard_tool or 'clipboard'} for text input")
     print("="*60)
     print("\nThis will:")
     print(f"  1. Record audio for {DURATION} seconds")
@@ -68,8 +68,9 @@ def main():
         sys.exit(0)
 
     try:
-        # Initialize transcriber (checks whisper.cpp connection)
+        # Initialize transcriber and check whisper.cpp before recording
         transcriber = VoiceTranscriber()
+        transcriber.ensure_server()
 
         # Record audio
         audio_data = transcriber.record_audio()
@@ -95,6 +96,10 @@ def main():
     except KeyboardInterrupt:
         print("\n\nInterrupted. Exiting.")
         sys.exit(0)
+    except WhisperServerDown:
+        print()
+        print_server_help()
+        sys.exit(1)
     except Exception as e:
         print(f"\n✗ Error: {e}")
         sys.exit(1)